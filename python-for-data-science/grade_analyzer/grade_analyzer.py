@@ -1,5 +1,84 @@
 # GradeAnalyzer.py
 
+import copy
+import csv
+import functools
+import io
+import itertools
+import re
+from operator import itemgetter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Lower bounds of the E, D, C, B and A bands; anything below 50 is an F.
+_THRESHOLDS = np.array([50, 60, 70, 80, 90])
+_LETTERS = np.array(['F', 'E', 'D', 'C', 'B', 'A'])
+# Default average a student needs to be reported as passing; students
+# below it are the ones listed as struggling
+_PASSING_THRESHOLD = 60
+_STRUGGLING_KEY = f'struggling_students (<{_PASSING_THRESHOLD})'
+# A grade field: an optionally signed integer of at most three significant
+# digits, so 67.0, 1e1 and the like are rejected as they were when grades
+# went through int(), and no accepted field can overflow the parser
+_WHOLE_NUMBER = r'\s*[+-]?0*[0-9]{1,3}\s*'
+# Rows parsed per pandas chunk while loading, to bound peak memory
+_CHUNK_SIZE = 65536
+
+
+class _DataNotLoaded(RuntimeError):
+    """Raised when an analysis method is called before data is loaded."""
+
+
+def _report_errors(action, default=None):
+    """
+    Decorator that prints errors and returns a fallback value. Calls made
+    before the data is loaded print only the not-loaded message.
+    Args:
+        action (str): Description used in the message, e.g. "loading data".
+        default: Value returned when the wrapped method raises.
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except _DataNotLoaded as e:
+                print(e)
+                return copy.copy(default)
+            except Exception as e:
+                print(f"Error {action}: {e}")
+                # Copy so callers never share a mutable fallback like [] or {}
+                return copy.copy(default)
+        return wrapper
+    return decorator
+
+
+def _letter_buckets(scores):
+    """
+    Maps scores to letter bucket indices (0 for F up to 5 for A).
+    Args:
+        scores (array-like): The numerical scores.
+    Returns:
+        numpy.ndarray: Bucket index per score, indexing _LETTERS.
+    """
+    return np.searchsorted(_THRESHOLDS, scores, side='right')
+
+
+def _letter_distribution(counts):
+    """
+    Turns per-bucket counts (F..A order) into a letter grade distribution.
+    Args:
+        counts (numpy.ndarray): Number of scores in each letter bucket.
+    Returns:
+        dict: Distribution of letter grades, A first.
+    """
+    return dict(zip(_LETTERS[::-1].tolist(), counts[::-1].tolist()))
+
+
 class GradeAnalyzer:
     def __init__(self, filename):
         """
@@ -8,18 +87,75 @@ class GradeAnalyzer:
             filename (str): Path to the student grades data file.
         """
         self._filename = filename
-        self._students = []
+        # Student dictionaries are only built when something asks for them
+        self._students = ()
+        self._id_index = {}
         self._subjects = ['Math', 'Physics', 'Chemistry', 'Biology', 'English']
+        self._subject_set = frozenset(self._subjects)
+        self._subject_index = {subject: i for i,
+                               subject in enumerate(self._subjects)}
+        # Column-oriented copy of the data: one row per student, one column
+        # per subject (in the order of self._subjects).
+        self._ids = np.empty(0, dtype=object)
+        self._names = np.empty(0, dtype=object)
+        self._grades = np.empty((0, len(self._subjects)), dtype=np.int8)
+        # Averages, rankings and course statistics are computed once per
+        # load and served from here
+        self._compute_summaries()
         self._loaded = False
 
     @property
     def students(self):
         """
-        Getter for the list of students.
+        Getter for the students.
+        Returns:
+            tuple: Student dictionaries, cached and shared between calls, so
+            treat them as read-only; validate_student_id returns a copy.
+        """
+        return self._student_records()
+
+    def _student_record(self, idx):
+        """
+        Builds the student dictionary for one row of the grade matrix.
+        Args:
+            idx (int): Row index of the student.
+        Returns:
+            dict: Student dictionary.
+        """
+        return {
+            'id': self._ids[idx],
+            'name': self._names[idx],
+            'grades': dict(zip(self._subjects, self._grades[idx].tolist()))
+        }
+
+    def _student_records(self):
+        """
+        Returns the cached student dictionaries, building them on first use.
+        Returns:
+            tuple: Student dictionaries.
+        """
+        if self._students is None:
+            self._students = tuple(self._student_record(i)
+                                   for i in range(len(self._ids)))
+        return self._students
+
+    @property
+    def loaded(self):
+        """
+        Whether student data has been loaded.
         Returns:
-            list: List of student dictionaries.
+            bool: True if data is loaded, False otherwise.
         """
-        return self._students.copy()
+        return self._loaded
+
+    def _require_loaded(self):
+        """
+        Raises _DataNotLoaded if the student data has not been loaded.
+        Returns:
+            None
+        """
+        if not self._loaded:
+            raise _DataNotLoaded("Data not loaded. Please load the data first.")
 
     def check_data_loaded(self):
         """
@@ -40,20 +176,28 @@ class GradeAnalyzer:
         Returns:
             dict or None: Student dictionary if found, None otherwise.
         """
-        try:
-            if not isinstance(student_id, str):
-                print("Student ID must be a string.")
-                return None
-            student = next(
-                (s for s in self._students if s['id'] == student_id), None)
-            if not student:
-                print(f"Student with ID {student_id} not found.")
-                return None
-            return student
-        except Exception as e:
-            print(f"Error validating student ID: {e}")
+        idx = self._student_index(student_id)
+        if idx is None:
             return None
+        return self._student_record(idx)
 
+    def _student_index(self, student_id):
+        """
+        Validates the student ID and returns the student's row index.
+        Args:
+            student_id (str): The student ID to validate.
+        Returns:
+            int or None: Row index if found, None otherwise.
+        """
+        if not isinstance(student_id, str):
+            print("Student ID must be a string.")
+            return None
+        idx = self._id_index.get(student_id)
+        if idx is None:
+            print(f"Student with ID {student_id} not found.")
+        return idx
+
+    @_report_errors("validating course name")
     def validate_course_name(self, course_name):
         """
         Validates the course name.
@@ -62,41 +206,164 @@ class GradeAnalyzer:
         Returns:
             str or None: Course name if valid, None otherwise.
         """
-        try:
-            if not isinstance(course_name, str):
-                print("Course name must be a string.")
-                return None
-            if course_name not in self._subjects:
-                print(f"Course {course_name} is not valid.")
-                return None
-            return course_name
-        except Exception as e:
-            print(f"Error validating course name: {e}")
+        if not isinstance(course_name, str):
+            print("Course name must be a string.")
+            return None
+        if course_name not in self._subject_set:
+            print(f"Course {course_name} is not valid.")
             return None
+        return course_name
 
     def load_data(self):
         """
-        Loads the data from the file and populates the students list.
+        Loads the data from the file and populates the grade arrays.
         Returns:
             None
         """
         try:
+            # Every row is checked against this pattern before pandas sees it,
+            # so the C parser always gets exactly one field per column and can
+            # never infer an index column or truncate an over-long row.
+            row_pattern = re.compile(
+                r'[^,]*,[^,]*' + (',' + _WHOLE_NUMBER) * len(self._subjects))
+            self._students = None
+            self._loaded = False
+            ids = [np.empty(0, dtype=object)]
+            names = [np.empty(0, dtype=object)]
+            grades = [np.empty((0, len(self._subjects)), dtype=np.int8)]
             with open(self._filename, 'r') as file:
-                self._students = []
-                self._loaded = False
-                next(file)
-                for line in file:
-                    student = self.parse_student_line(line)
-                    if student:
-                        self._students.append(student)
-                self._loaded = True
-                print(f"Data loaded successfully from {self._filename}.")
+                if not file.readline():
+                    raise ValueError("the file has no header line")
+                line_number = 2
+                while True:
+                    lines = [line.strip()
+                             for line in itertools.islice(file, _CHUNK_SIZE)]
+                    if not lines:
+                        break
+                    chunk = self._parse_lines(lines, line_number, row_pattern)
+                    line_number += len(lines)
+                    ids.append(chunk['id'].to_numpy(dtype=object))
+                    names.append(chunk['name'].to_numpy(dtype=object))
+                    grades.append(chunk[self._subjects].to_numpy(dtype=np.int8))
+            self._ids = np.concatenate(ids)
+            self._names = np.concatenate(names)
+            self._grades = np.concatenate(grades)
+            self._id_index = {}
+            for idx, student_id in enumerate(self._ids.tolist()):
+                # Keep the first occurrence of a duplicated ID
+                self._id_index.setdefault(student_id, idx)
+            self._compute_summaries()
+            self._loaded = True
+            print(f"Data loaded successfully from {self._filename}.")
         except FileNotFoundError as e:
             print(f"File not found: {e}")
         except Exception as e:
             print(f"Error loading data: {e}")
             self._loaded = False
 
+    def _parse_lines(self, lines, first_line_number, row_pattern):
+        """
+        Parses a chunk of stripped data lines, skipping rows that do not have
+        exactly one field per column, whole-number grades and grades in 0-100
+        (the range the int8 grade matrix is meant to hold).
+        Args:
+            lines (list): Stripped lines read from the data file.
+            first_line_number (int): File line number of the first line.
+            row_pattern (re.Pattern): Pattern a well-formed row must match.
+        Returns:
+            pandas.DataFrame: The valid rows, with integer grade columns.
+        """
+        valid = [line for line in lines if row_pattern.fullmatch(line)]
+        if len(valid) < len(lines):
+            n_fields = 2 + len(self._subjects)
+            for number, line in enumerate(lines, first_line_number):
+                if row_pattern.fullmatch(line):
+                    continue
+                if line.count(',') + 1 != n_fields:
+                    print(f"Skipping invalid line {number} (expected {n_fields} "
+                          f"fields, got {line.count(',') + 1}): {line}")
+                else:
+                    print(f"Skipping invalid line {number} (grades must be "
+                          f"whole numbers 0-100): {line}")
+        columns = ['id', 'name', *self._subjects]
+        if not valid:
+            return pd.DataFrame(columns=columns)
+        frame = pd.read_csv(
+            io.StringIO('\n'.join(valid)), header=None, names=columns,
+            dtype={'id': str, 'name': str,
+                   **dict.fromkeys(self._subjects, np.int64)},
+            keep_default_na=False, quoting=csv.QUOTE_NONE, engine='c')
+        grades = frame[self._subjects]
+        in_range = (grades.ge(0).all(axis=1) & grades.le(100).all(axis=1)).to_numpy()
+        if not in_range.all():
+            numbers = [number for number, line in enumerate(lines, first_line_number)
+                       if row_pattern.fullmatch(line)]
+            for idx in np.flatnonzero(~in_range).tolist():
+                print(f"Skipping invalid line {numbers[idx]} (grades must be "
+                      f"whole numbers 0-100): {valid[idx]}")
+        return frame[in_range]
+
+    def _compute_summaries(self):
+        """
+        Precomputes per-student and per-course statistics from the grade
+        matrix, along with the student ranking. Every per-course query reads
+        from these results.
+        Returns:
+            None
+        """
+        n, n_subjects = self._grades.shape
+        n_letters = len(_LETTERS)
+        if n == 0:
+            self._student_means = np.empty(0)
+            self._course_means = np.zeros(n_subjects)
+            self._rank_order = np.empty(0, dtype=np.intp)
+            self._ascending_means = np.empty(0)
+            self._course_medians = [None] * n_subjects
+            self._course_highest = [0] * n_subjects
+            self._course_lowest = [0] * n_subjects
+            self._course_counts = np.zeros((n_subjects, n_letters), dtype=np.intp)
+            return
+        self._student_means = self._grades.mean(axis=1)
+        self._course_means = self._grades.mean(axis=0)
+        # Stable sort keeps file order among students with equal averages
+        self._rank_order = np.argsort(-self._student_means, kind='stable')
+        self._ascending_means = self._student_means[self._rank_order[::-1]]
+        # Medians by selection; odd class sizes keep the integer score
+        mid = n // 2
+        if n % 2:
+            self._course_medians = np.partition(
+                self._grades, mid, axis=0)[mid].tolist()
+        else:
+            middle = np.partition(self._grades, (mid - 1, mid), axis=0)
+            self._course_medians = [
+                (lower + upper) / 2 for lower, upper
+                in zip(middle[mid - 1].tolist(), middle[mid].tolist())]
+        self._course_highest = self._grades.max(axis=0).tolist()
+        self._course_lowest = self._grades.min(axis=0).tolist()
+        # Offset each column's buckets so one bincount covers every subject
+        buckets = _letter_buckets(self._grades) + np.arange(n_subjects) * n_letters
+        self._course_counts = np.bincount(
+            buckets.ravel(), minlength=n_subjects * n_letters
+        ).reshape(n_subjects, n_letters)
+
+    def _course_statistics(self, col):
+        """
+        Builds the statistics dictionary for one course from the precomputed
+        per-course results.
+        Args:
+            col (int): Column index of the course.
+        Returns:
+            dict: Dictionary of statistics.
+        """
+        return {
+            'average': float(self._course_means[col]),
+            'median': self._course_medians[col],
+            'highest': self._course_highest[col],
+            'lowest': self._course_lowest[col],
+            'distribution': _letter_distribution(self._course_counts[col])
+        }
+
+    @_report_errors("parsing student line")
     def parse_student_line(self, line):
         """
         Parses a line from the file and returns a dictionary with student data.
@@ -105,73 +372,67 @@ class GradeAnalyzer:
         Returns:
             dict or None: Student dictionary if valid, None otherwise.
         """
-        try:
-            parts = line.strip().split(',')
-            if len(parts) != 7:
-                print(
-                    f"Skipping invalid line (expected 7 fields): {line.strip()}")
-                return None
-            student = {
-                'id': parts[0],
-                'name': parts[1],
-                'grades': {
-                    'Math': int(parts[2]),
-                    'Physics': int(parts[3]),
-                    'Chemistry': int(parts[4]),
-                    'Biology': int(parts[5]),
-                    'English': int(parts[6]),
-                }
+        parts = line.strip().split(',')
+        if len(parts) != 7:
+            print(
+                f"Skipping invalid line (expected 7 fields): {line.strip()}")
+            return None
+        student = {
+            'id': parts[0],
+            'name': parts[1],
+            'grades': {
+                'Math': int(parts[2]),
+                'Physics': int(parts[3]),
+                'Chemistry': int(parts[4]),
+                'Biology': int(parts[5]),
+                'English': int(parts[6]),
             }
-            return student
-        except Exception as e:
-            print(f"Error parsing student line: {e}")
+        }
+        # Grades are stored as int8, so reject anything outside 0-100
+        if any(grade < 0 or grade > 100 for grade in student['grades'].values()):
+            print(
+                f"Skipping invalid line (grades must be 0-100): {line.strip()}")
             return None
+        return student
 
+    @_report_errors("validating data integrity", default=False)
     def validate_data(self):
         """
         Checks loaded data for integrity.
         Returns:
             bool: True if data is valid, False otherwise.
         """
-        try:
-            if self.check_data_loaded() is False:
+        self._require_loaded()
+        print('Validating loaded data...')
+        for student in self._student_records():
+            if not isinstance(student, dict):
+                print(f"Invalid data format for student: {student}")
                 return False
-            print('Validating loaded data...')
-            for student in self._students:
-                if not isinstance(student, dict):
-                    print(f"Invalid data format for student: {student}")
-                    return False
-                if 'name' not in student or 'id' not in student or 'grades' not in student:
-                    print(
-                        f"Missing required fields in student data: {student}")
-                    return False
-                if not isinstance(student['name'], str) or not isinstance(student['id'], str):
-                    print(f"Invalid name or ID for student: {student}")
-                    return False
-                if not isinstance(student['grades'], dict) or len(student['grades']) != len(self._subjects):
-                    print(
-                        f"Invalid grades for student {student.get('name', 'Unknown')} ({student.get('id', 'Unknown')}).")
-                    return False
-            print('Data validation successful.')
-            return True
-        except Exception as e:
-            print(f"Error validating data integrity: {e}")
-            return False
+            if 'name' not in student or 'id' not in student or 'grades' not in student:
+                print(
+                    f"Missing required fields in student data: {student}")
+                return False
+            if not isinstance(student['name'], str) or not isinstance(student['id'], str):
+                print(f"Invalid name or ID for student: {student}")
+                return False
+            if not isinstance(student['grades'], dict) or len(student['grades']) != len(self._subjects):
+                print(
+                    f"Invalid grades for student {student.get('name', 'Unknown')} ({student.get('id', 'Unknown')}).")
+                return False
+        print('Data validation successful.')
+        return True
 
+    @_report_errors("getting student count", default=0)
     def get_student_count(self):
         """
         Returns the number of students loaded.
         Returns:
             int: Number of students.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return 0
-            return len(self._students)
-        except Exception as e:
-            print(f"Error getting student count: {e}")
-            return 0
+        self._require_loaded()
+        return len(self._ids)
 
+    @_report_errors("calculating student average")
     def calculate_student_average(self, student_id):
         """
         Calculates the overall average grade for a student.
@@ -180,17 +441,13 @@ class GradeAnalyzer:
         Returns:
             float or None: Average grade if student found, None otherwise.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return None
-            student = self.validate_student_id(student_id)
-            if not student:
-                return None
-            return sum(student['grades'].values()) / len(student['grades'])
-        except Exception as e:
-            print(f"Error calculating student average: {e}")
+        self._require_loaded()
+        idx = self._student_index(student_id)
+        if idx is None:
             return None
+        return float(self._student_means[idx])
 
+    @_report_errors("getting highest score for student")
     def get_student_highest_score(self, student_id):
         """
         Gets the highest score for a student.
@@ -199,17 +456,14 @@ class GradeAnalyzer:
         Returns:
             tuple or None: (subject, score) if student found, None otherwise.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return None
-            student = self.validate_student_id(student_id)
-            if not student:
-                return None
-            return max(student['grades'].items(), key=lambda item: item[1])
-        except Exception as e:
-            print(f"Error getting highest score for student: {e}")
+        self._require_loaded()
+        idx = self._student_index(student_id)
+        if idx is None:
             return None
+        col = int(self._grades[idx].argmax())
+        return self._subjects[col], int(self._grades[idx, col])
 
+    @_report_errors("getting lowest score for student")
     def get_student_lowest_score(self, student_id):
         """
         Gets the lowest score for a student.
@@ -218,42 +472,35 @@ class GradeAnalyzer:
         Returns:
             tuple or None: (subject, score) if student found, None otherwise.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return None
-            student = self.validate_student_id(student_id)
-            if not student:
-                return None
-            return min(student['grades'].items(), key=lambda item: item[1])
-        except Exception as e:
-            print(f"Error getting lowest score for student: {e}")
+        self._require_loaded()
+        idx = self._student_index(student_id)
+        if idx is None:
             return None
+        col = int(self._grades[idx].argmin())
+        return self._subjects[col], int(self._grades[idx, col])
 
-    def is_student_passing(self, student_id, threshold=60):
+    @_report_errors("determining if student is passing", default=False)
+    def is_student_passing(self, student_id, threshold=_PASSING_THRESHOLD):
         """
         Determines if a student has passed or failed based on average.
         Args:
             student_id (str): The student ID.
             threshold (int, optional): Passing threshold. Defaults to 60.
         Returns:
-            bool or None: True if passing, False if not, None if error.
+            bool or None: True if passing, False if not or if no data is
+            loaded, None for an unknown student or invalid threshold.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return False
-            student = self.validate_student_id(student_id)
-            if not student:
-                return None
-            if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 100:
-                print(
-                    f"Invalid threshold value: {threshold}. Must be between 0 and 100.")
-                return None
-            average = self.calculate_student_average(student_id)
-            return average is not None and average >= threshold
-        except Exception as e:
-            print(f"Error determining if student is passing: {e}")
+        self._require_loaded()
+        idx = self._student_index(student_id)
+        if idx is None:
+            return None
+        if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 100:
+            print(
+                f"Invalid threshold value: {threshold}. Must be between 0 and 100.")
             return None
+        return bool(self._student_means[idx] >= threshold)
 
+    @_report_errors("getting student info")
     def get_student_info(self, student_id):
         """
         Gets formatted student info.
@@ -262,20 +509,16 @@ class GradeAnalyzer:
         Returns:
             str or None: Formatted student info, None if not found.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return None
-            student = self.validate_student_id(student_id)
-            if not student:
-                return None
-            info = f"Student ID: {student['id']}\nName: {student['name']}\nGrades:\n"
-            for subject, grade in student['grades'].items():
-                info += f"  {subject}: {grade}\n"
-            return info
-        except Exception as e:
-            print(f"Error getting student info: {e}")
+        self._require_loaded()
+        student = self.validate_student_id(student_id)
+        if not student:
             return None
+        parts = [f"Student ID: {student['id']}\nName: {student['name']}\nGrades:\n"]
+        for subject, grade in student['grades'].items():
+            parts.append(f"  {subject}: {grade}\n")
+        return "".join(parts)
 
+    @_report_errors("converting score to letter grade")
     def convert_to_letter_grade(self, score):
         """
         Converts a numerical score to a letter grade.
@@ -284,20 +527,33 @@ class GradeAnalyzer:
         Returns:
             str or None: Letter grade, None if invalid score.
         """
-        try:
-            if not isinstance(score, (int, float)) or score < 0 or score > 100:
-                print(
-                    f"Invalid score value: {score}. Must be a number between 0 and 100.")
-                return None
-            grades = [(90, 'A'), (80, 'B'), (70, 'C'), (60, 'D'), (50, 'E')]
-            for threshold, letter in grades:
-                if score >= threshold:
-                    return letter
-            return 'F'
-        except Exception as e:
-            print(f"Error converting score to letter grade: {e}")
+        if not isinstance(score, (int, float)) or score < 0 or score > 100:
+            print(
+                f"Invalid score value: {score}. Must be a number between 0 and 100.")
+            return None
+        grades = [(90, 'A'), (80, 'B'), (70, 'C'), (60, 'D'), (50, 'E')]
+        for threshold, letter in grades:
+            if score >= threshold:
+                return letter
+        return 'F'
+
+    @_report_errors("converting scores to letter grades")
+    def convert_scores_to_letters(self, scores):
+        """
+        Converts an array of numerical scores to letter grades in one pass.
+        Args:
+            scores (array-like): The numerical scores.
+        Returns:
+            numpy.ndarray or None: Letter grades with the same shape as scores,
+            None if any score is invalid.
+        """
+        scores = np.asarray(scores)
+        if scores.size and (scores.min() < 0 or scores.max() > 100):
+            print("Invalid score values. Must be numbers between 0 and 100.")
             return None
+        return _LETTERS[_letter_buckets(scores)]
 
+    @_report_errors("getting course scores", default=[])
     def get_course_scores(self, course_name):
         """
         Lists all scores for one subject.
@@ -306,17 +562,13 @@ class GradeAnalyzer:
         Returns:
             list: List of scores for the subject.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return []
-            course = self.validate_course_name(course_name)
-            if not course:
-                return []
-            return [student['grades'].get(course_name, 0) for student in self._students]
-        except Exception as e:
-            print(f"Error getting course scores: {e}")
+        self._require_loaded()
+        course = self.validate_course_name(course_name)
+        if not course:
             return []
+        return self._grades[:, self._subject_index[course_name]].tolist()
 
+    @_report_errors("calculating course average", default=0)
     def calculate_course_average(self, course_name):
         """
         Finds the average score for a subject.
@@ -325,17 +577,12 @@ class GradeAnalyzer:
         Returns:
             float: Average score for the subject.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return 0
-            if not self.validate_course_name(course_name):
-                return 0
-            scores = self.get_course_scores(course_name)
-            return sum(scores) / len(scores) if scores else 0
-        except Exception as e:
-            print(f"Error calculating course average: {e}")
+        self._require_loaded()
+        if not self.validate_course_name(course_name):
             return 0
+        return float(self._course_means[self._subject_index[course_name]])
 
+    @_report_errors("finding course median")
     def find_course_median(self, course_name):
         """
         Finds the median score for a subject.
@@ -344,17 +591,12 @@ class GradeAnalyzer:
         Returns:
             float or None: Median score, None if no scores.
         """
-        try:
-            scores = sorted(self.get_course_scores(course_name))
-            n = len(scores)
-            if n == 0:
-                return None
-            mid = n // 2
-            return scores[mid] if n % 2 else (scores[mid - 1] + scores[mid]) / 2
-        except Exception as e:
-            print(f"Error finding course median: {e}")
+        self._require_loaded()
+        if not self.validate_course_name(course_name):
             return None
+        return self._course_medians[self._subject_index[course_name]]
 
+    @_report_errors("getting course grade distribution", default={})
     def get_course_grade_distribution(self, course_name):
         """
         Gets the count distribution of letter grades for a subject.
@@ -363,37 +605,24 @@ class GradeAnalyzer:
         Returns:
             dict: Distribution of letter grades.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return {}
-            if not self.validate_course_name(course_name):
-                return {}
-            distribution = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'E': 0, 'F': 0}
-            for score in self.get_course_scores(course_name):
-                letter_grade = self.convert_to_letter_grade(score)
-                distribution[letter_grade] += 1
-            return distribution
-        except Exception as e:
-            print(f"Error getting course grade distribution: {e}")
+        self._require_loaded()
+        if not self.validate_course_name(course_name):
             return {}
+        return _letter_distribution(
+            self._course_counts[self._subject_index[course_name]])
 
+    @_report_errors("ranking courses by difficulty", default=[])
     def rank_courses_by_difficulty(self):
         """
         Ranks courses by difficulty (hardest first, lowest average).
         Returns:
             list: List of (subject, average) tuples sorted by average ascending.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return []
-            averages = {}
-            for subject in self._subjects:
-                averages[subject] = self.calculate_course_average(subject)
-            return sorted(averages.items(), key=lambda item: item[1])
-        except Exception as e:
-            print(f"Error ranking courses by difficulty: {e}")
-            return []
+        self._require_loaded()
+        averages = zip(self._subjects, self._course_means.tolist())
+        return sorted(averages, key=itemgetter(1))
 
+    @_report_errors("getting course statistics")
     def get_course_statistics(self, course_name):
         """
         Gets comprehensive statistics for a course.
@@ -402,44 +631,24 @@ class GradeAnalyzer:
         Returns:
             dict or None: Dictionary of statistics, None if error.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return None
-            if not self.validate_course_name(course_name):
-                return None
-            average = self.calculate_course_average(course_name)
-            median = self.find_course_median(course_name)
-            highest = max(self.get_course_scores(course_name), default=0)
-            lowest = min(self.get_course_scores(course_name), default=0)
-            distribution = self.get_course_grade_distribution(course_name)
-
-            return {
-                'average': average,
-                'median': median,
-                'highest': highest,
-                'lowest': lowest,
-                'distribution': distribution
-            }
-        except Exception as e:
-            print(f"Error getting course statistics: {e}")
+        self._require_loaded()
+        if not self.validate_course_name(course_name):
             return None
+        return self._course_statistics(self._subject_index[course_name])
 
+    @_report_errors("ranking students by average", default=[])
     def rank_students_by_average(self):
         """
         Ranks students by average score.
         Returns:
             list: List of (student_id, average) tuples sorted descending.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return []
-            averages = [(student['id'], self.calculate_student_average(
-                student['id'])) for student in self._students]
-            return sorted(averages, key=lambda item: item[1], reverse=True)
-        except Exception as e:
-            print(f"Error ranking students by average: {e}")
-            return []
+        self._require_loaded()
+        order = self._rank_order
+        return list(zip(self._ids[order].tolist(),
+                        self._student_means[order].tolist()))
 
+    @_report_errors("getting top performers", default=[])
     def get_top_performers(self, n=5):
         """
         Gets the top N students by average score.
@@ -448,103 +657,96 @@ class GradeAnalyzer:
         Returns:
             list: List of (student_id, average) tuples.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return []
-            if not isinstance(n, int) or n <= 0:
-                print(f"Invalid value for n: {n}. Must be a positive integer.")
-                return []
-            return self.rank_students_by_average()[:n]
-        except Exception as e:
-            print(f"Error getting top performers: {e}")
+        self._require_loaded()
+        if not isinstance(n, int) or n <= 0:
+            print(f"Invalid value for n: {n}. Must be a positive integer.")
             return []
+        order = self._rank_order[:n]
+        return list(zip(self._ids[order].tolist(),
+                        self._student_means[order].tolist()))
 
-    def get_struggling_students(self, threshold=60):
+    @_report_errors("getting struggling students", default=[])
+    def get_struggling_students(self, threshold=_PASSING_THRESHOLD):
         """
         Gets students below a certain average score.
         Args:
-            threshold (int or float): The threshold for struggling students.
+            threshold (int or float, optional): The threshold for struggling
+                students. Defaults to the passing threshold (60).
         Returns:
             list: List of student dictionaries below the threshold.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return []
-            if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 100:
-                print(
-                    f"Invalid threshold value: {threshold}. Must be between 0 and 100.")
-                return []
-            return [student for student in self._students if self.calculate_student_average(student['id']) < threshold]
-        except Exception as e:
-            print(f"Error getting struggling students: {e}")
+        self._require_loaded()
+        if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 100:
+            print(
+                f"Invalid threshold value: {threshold}. Must be between 0 and 100.")
             return []
+        count = np.searchsorted(self._ascending_means, threshold, side='left')
+        # Lowest averages come last in the ranking; report them in file order
+        below = np.sort(self._rank_order[len(self._rank_order) - count:])
+        return [self._student_record(i) for i in below.tolist()]
 
+    @_report_errors("calculating class statistics")
     def calculate_class_statistics(self):
         """
         Calculates overall class performance statistics.
         Returns:
             dict or None: Dictionary of class statistics, None if error.
         """
-        try:
-            if not self.check_data_loaded():
-                return None
-            subject_stats = {
-                subject: self.get_course_statistics(subject)
-                for subject in self._subjects
-            }
-            metrics = {
-                'top_performers': self.get_top_performers(n=5),
-                'struggling_students (<60)': self.get_struggling_students(threshold=60),
-                'subject_statistics': subject_stats,
-                'student_count': len(self._students)
-            }
-            return metrics
-        except Exception as e:
-            print(f"Error calculating class statistics: {e}")
-            return None
+        self._require_loaded()
+        subject_stats = self._all_course_statistics()
+        metrics = {
+            'top_performers': self.get_top_performers(n=5),
+            _STRUGGLING_KEY: self.get_struggling_students(),
+            'subject_statistics': subject_stats,
+            'student_count': len(self._ids)
+        }
+        return metrics
+
+    def _all_course_statistics(self):
+        """
+        Gets get_course_statistics for every subject.
+        Returns:
+            dict: Dictionary of subject to statistics.
+        """
+        return {subject: self._course_statistics(col)
+                for col, subject in enumerate(self._subjects)}
 
+    @_report_errors("finding subject correlations", default=[])
     def find_subject_correlations(self):
         """
         Finds and presents subject correlations as plain floats, sorted by strength.
         Returns:
             list: List of tuples (subject1, subject2, correlation) sorted by absolute correlation descending.
         """
-        try:
-            import numpy as np
-            if not self.check_data_loaded():
-                return []
-            scores = {subject: [student['grades'][subject]
-                                for student in self._students] for subject in self._subjects}
-            correlations = []
-            for i, s1 in enumerate(self._subjects):
-                for s2 in self._subjects[i+1:]:
-                    corr = float(np.corrcoef(scores[s1], scores[s2])[0, 1])
-                    correlations.append((s1, s2, corr))
-            # Sort by absolute correlation descending
-            correlations.sort(key=lambda x: abs(x[2]), reverse=True)
-            # for s1, s2, corr in correlations:
-            #     print(f"{s1} & {s2}: {corr:.2f}")
-            return correlations
-        except Exception as e:
-            print(f"Error finding subject correlations: {e}")
-            return {}
-
+        self._require_loaded()
+        # One pass over the whole matrix, then read off the upper triangle
+        matrix = np.corrcoef(self._grades, rowvar=False)
+        rows, cols = np.triu_indices(len(self._subjects), k=1)
+        values = matrix[rows, cols]
+        # Lead each entry with its absolute value so the sort key is a C getter
+        keyed = list(zip(np.abs(values).tolist(), rows.tolist(), cols.tolist(),
+                         values.tolist()))
+        # Sort by absolute correlation descending
+        keyed.sort(key=itemgetter(0), reverse=True)
+        correlations = [(self._subjects[i], self._subjects[j], corr)
+                        for _, i, j, corr in keyed]
+        # for s1, s2, corr in correlations:
+        #     print(f"{s1} & {s2}: {corr:.2f}")
+        return correlations
+
+    @_report_errors("getting grade distribution summary", default={})
     def get_grade_distribution_summary(self):
         """
         Gets grade distribution across all subjects.
         Returns:
             dict: Dictionary of subject to grade distribution.
         """
-        try:
-            if self.check_data_loaded() is False:
-                return {}
-            distribution = {subject: self.get_course_grade_distribution(
-                subject) for subject in self._subjects}
-            return distribution
-        except Exception as e:
-            print(f"Error getting grade distribution summary: {e}")
-            return {}
+        self._require_loaded()
+        distribution = {subject: self.get_course_grade_distribution(
+            subject) for subject in self._subjects}
+        return distribution
 
+    @_report_errors("generating student report")
     def generate_student_report(self, student_id):
         """
         Generates a detailed report for a student.
@@ -553,36 +755,63 @@ class GradeAnalyzer:
         Returns:
             str or None: Report string, None if error.
         """
-        try:
-            if not self.check_data_loaded():
-                return None
-            student_data = self.validate_student_id(student_id)
-            if student_data is None:
-                return None
-            info = self.get_student_info(student_id)
-            avg = self.calculate_student_average(student_id)
-            high = self.get_student_highest_score(student_id)
-            low = self.get_student_lowest_score(student_id)
-            status = "Passing" if self.is_student_passing(
-                student_id) else "Failing"
-            report = (
-                f"{info}"
-                f"Average Score: {avg:.2f}\n"
-                f"Highest Score: {high[0]} ({high[1]})\n"
-                f"Lowest Score: {low[0]} ({low[1]})\n"
-                f"Passing Status: {status}\n"
-                "Letter Grades:\n"
-            )
-            report += "".join(
-                f"  {subject}: {self.convert_to_letter_grade(score)}\n"
-                for subject, score in student_data['grades'].items()
-            )
-            report += "\n"
-            return report
-        except Exception as e:
-            print(f"Error generating student report: {e}")
+        self._require_loaded()
+        idx = self._student_index(student_id)
+        if idx is None:
             return None
+        grades = self._grades[idx]
+        return self._format_student_report(
+            idx, self._student_means[idx], grades.argmax(), grades.argmin(),
+            self.convert_scores_to_letters(grades).tolist())
 
+    @_report_errors("generating student reports")
+    def generate_all_student_reports(self):
+        """
+        Generates the detailed report for every student in one batch.
+        Returns:
+            str or None: All student reports in file order, None if error.
+        """
+        self._require_loaded()
+        highest = self._grades.argmax(axis=1).tolist()
+        lowest = self._grades.argmin(axis=1).tolist()
+        letters = self.convert_scores_to_letters(self._grades).tolist()
+        means = self._student_means.tolist()
+        return "".join(
+            self._format_student_report(
+                idx, means[idx], highest[idx], lowest[idx], letters[idx])
+            for idx in range(len(self._ids))
+        )
+
+    def _format_student_report(self, idx, average, high_col, low_col, letters):
+        """
+        Formats the detailed report for one student from precomputed values.
+        Args:
+            idx (int): Row index of the student.
+            average (float): The student's average score.
+            high_col (int): Column of the student's highest score.
+            low_col (int): Column of the student's lowest score.
+            letters (list): Letter grade per subject.
+        Returns:
+            str: Report string.
+        """
+        scores = self._grades[idx].tolist()
+        status = "Passing" if average >= _PASSING_THRESHOLD else "Failing"
+        parts = [f"Student ID: {self._ids[idx]}\nName: {self._names[idx]}\nGrades:\n"]
+        parts.extend(f"  {subject}: {score}\n"
+                     for subject, score in zip(self._subjects, scores))
+        parts.append(
+            f"Average Score: {average:.2f}\n"
+            f"Highest Score: {self._subjects[high_col]} ({scores[high_col]})\n"
+            f"Lowest Score: {self._subjects[low_col]} ({scores[low_col]})\n"
+            f"Passing Status: {status}\n"
+            "Letter Grades:\n"
+        )
+        parts.extend(f"  {subject}: {letter}\n"
+                     for subject, letter in zip(self._subjects, letters))
+        parts.append("\n")
+        return "".join(parts)
+
+    @_report_errors("generating course report")
     def generate_course_report(self, course_name):
         """
         Generates a report for a course.
@@ -591,62 +820,55 @@ class GradeAnalyzer:
         Returns:
             str or None: Report string, None if error.
         """
-        try:
-            if not self.check_data_loaded():
-                return None
-
-            if self.validate_course_name(course_name) is None:
-                return None
-
-            stats = self.get_course_statistics(course_name)
-            if stats is None:
-                return None
-
-            report = (
-                f"Course: {course_name}\n"
-                f"Average Score: {stats['average']:.2f}\n"
-                f"Highest Score: {stats['highest']:.2f}\n"
-                f"Lowest Score: {stats['lowest']:.2f}\n"
-                f"Distribution: {stats['distribution']}\n"
-                f"Total Students: {len(self._students)}\n"
-            )
-            return report
-        except Exception as e:
-            print(f"Error generating course report: {e}")
+        self._require_loaded()
+
+        if self.validate_course_name(course_name) is None:
             return None
 
+        stats = self.get_course_statistics(course_name)
+        if stats is None:
+            return None
+
+        report = (
+            f"Course: {course_name}\n"
+            f"Average Score: {stats['average']:.2f}\n"
+            f"Highest Score: {stats['highest']:.2f}\n"
+            f"Lowest Score: {stats['lowest']:.2f}\n"
+            f"Distribution: {stats['distribution']}\n"
+            f"Total Students: {len(self._ids)}\n"
+        )
+        return report
+
+    @_report_errors("generating class overview")
     def generate_class_overview(self):
         """
         Generates a class-wide report.
         Returns:
             str or None: Report string, None if error.
         """
-        try:
-            if not self.check_data_loaded():
-                return None
-            overall_stats = self.calculate_class_statistics()
-            if overall_stats is None:
-                return None
-            report = (
-                f"Class Overview\n"
-                f"Total Students: {overall_stats['student_count']}\n"
-                f"Top Performers: {overall_stats['top_performers']}\n"
-                f"Struggling Students (<60): {overall_stats['struggling_students (<60)']}\n"
-            )
-            for subject, stats in overall_stats['subject_statistics'].items():
-                report += (
-                    f"Subject: {subject}\n"
-                    f"  Average: {stats['average']:.2f}\n"
-                    f"  Highest: {stats['highest']:.2f}\n"
-                    f"  Lowest: {stats['lowest']:.2f}\n"
-                    f"  Distribution: {stats['distribution']}\n"
-                    f"  Total Students: {len(self._students)}\n"
-                )
-            return report
-        except Exception as e:
-            print(f"Error generating class overview: {e}")
+        self._require_loaded()
+        overall_stats = self.calculate_class_statistics()
+        if overall_stats is None:
             return None
+        parts = [
+            f"Class Overview\n"
+            f"Total Students: {overall_stats['student_count']}\n"
+            f"Top Performers: {overall_stats['top_performers']}\n"
+            f"Struggling Students (<{_PASSING_THRESHOLD}): "
+            f"{overall_stats[_STRUGGLING_KEY]}\n"
+        ]
+        for subject, stats in overall_stats['subject_statistics'].items():
+            parts.append(
+                f"Subject: {subject}\n"
+                f"  Average: {stats['average']:.2f}\n"
+                f"  Highest: {stats['highest']:.2f}\n"
+                f"  Lowest: {stats['lowest']:.2f}\n"
+                f"  Distribution: {stats['distribution']}\n"
+                f"  Total Students: {len(self._ids)}\n"
+            )
+        return "".join(parts)
 
+    @_report_errors("saving report to file")
     def save_report_to_file(self, report_content, filename):
         """
         Saves a report to a file.
@@ -656,44 +878,36 @@ class GradeAnalyzer:
         Returns:
             None
         """
-        try:
-            if not report_content:
-                print("No report content to save.")
-                return
-            if not filename.endswith('.txt'):
-                print("Filename must end with .txt")
-                return
-            if not isinstance(report_content, str):
-                print("Report content must be a string.")
-                return
-            with open(filename, 'w') as file:
-                file.write(report_content)
-            print(f"Report saved to {filename}.")
-        except Exception as e:
-            print(f"Error saving report to file: {e}")
+        if not report_content:
+            print("No report content to save.")
+            return
+        if not filename.endswith('.txt'):
+            print("Filename must end with .txt")
+            return
+        if not isinstance(report_content, str):
+            print("Report content must be a string.")
+            return
+        Path(filename).write_text(report_content)
+        print(f"Report saved to {filename}.")
 
+    @_report_errors("displaying summary")
     def display_summary(self):
         """
         Prints key statistics to the console.
         Returns:
             None
         """
-        try:
-            if not self.check_data_loaded():
-                return
-            print(f"Total Students: {self.get_student_count()}")
-            class_stats = self.calculate_class_statistics()
-            if not class_stats:
-                print("No class statistics available.")
-                return
-            print("Class-Wide Statistics:")
-            print(f"  Top Performers: {class_stats['top_performers']}")
-            print(
-                f"  Struggling Students: {class_stats['struggling_students (<60)']}")
-            print("Subject Averages:")
-            for subject, stats in class_stats['subject_statistics'].items():
-                if stats:
-                    print(f"  {subject}: {stats['average']:.2f}")
-        except Exception as e:
-            print(f"Error displaying summary: {e}")
+        self._require_loaded()
+        print(f"Total Students: {self.get_student_count()}")
+        class_stats = self.calculate_class_statistics()
+        if not class_stats:
+            print("No class statistics available.")
             return
+        print("Class-Wide Statistics:")
+        print(f"  Top Performers: {class_stats['top_performers']}")
+        print(
+            f"  Struggling Students: {class_stats[_STRUGGLING_KEY]}")
+        print("Subject Averages:")
+        for subject, stats in class_stats['subject_statistics'].items():
+            if stats:
+                print(f"  {subject}: {stats['average']:.2f}")
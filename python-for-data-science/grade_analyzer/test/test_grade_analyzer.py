@@ -1,3 +1,6 @@
+import tempfile
+from pathlib import Path
+
 from grade_analyzer import GradeAnalyzer
 
 
@@ -5,6 +8,7 @@ def main():
     # Initialize analyzer with your data file
     analyzer = GradeAnalyzer('student_grades.txt')
     analyzer.load_data()
+    print("Data loaded:", analyzer.loaded)
 
     # Test: Calculate average for a specific student
     print("Average for STU001:", analyzer.calculate_student_average('STU001'))
@@ -17,6 +21,17 @@ def main():
     for subject, avg in analyzer.rank_courses_by_difficulty():
         print(f"  {subject}: {avg:.2f}")
 
+    # Test: Convert a list of scores to letter grades
+    print("Letter grades for [95, 85, 75, 65, 55, 45]:",
+          analyzer.convert_scores_to_letters([95, 85, 75, 65, 55, 45]))
+
+    # Test: Batch reports match the individual student reports
+    all_reports = analyzer.generate_all_student_reports()
+    individual = "".join(analyzer.generate_student_report(student['id'])
+                         for student in analyzer.students)
+    assert all_reports == individual, "Batch reports differ from individual reports"
+    print("Generated reports for all", len(analyzer.students), "students")
+
     # Test: Display summary
     print("\nClass Summary:")
     analyzer.display_summary()
@@ -32,6 +47,20 @@ def main():
     for s1, s2, corr in correlations:
         print(f"{s1} & {s2}: {corr:.2f}")
 
+    # Test: An over-long row near the top is skipped without shifting the rest
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'early_bad_row.txt'
+        path.write_text("StudentID,Name,Math,Physics,Chemistry,Biology,English\n"
+                        "S1,Ann,85,78,92,88,76\n"
+                        "S2,Bob,72,85,68,79,82,99\n"
+                        "S3,Cy,90,91,92,93,94\n")
+        checked = GradeAnalyzer(str(path))
+        checked.load_data()
+        loaded_ids = [student['id'] for student in checked.students]
+        assert loaded_ids == ['S1', 'S3'], f"Unexpected students loaded: {loaded_ids}"
+        assert checked.students[0]['grades']['Math'] == 85
+        print("Students loaded around the over-long row:", loaded_ids)
+
 
 if __name__ == "__main__":
     main()